@@ -1,18 +1,236 @@
 import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image
+from PIL import Image, ImageFile
 from pillow_heif import register_heif_opener # Import the HEIF opener
 import subprocess # New: For running external scripts
 import sys # New: For correctly calling bundled Python scripts
+import concurrent.futures # For processing images on all cores
+import threading # Keeps the GUI responsive while the pool runs
+import time # For throttling status label updates
+import re
+import ctypes # For renameat2 on Linux
+import errno
+import contextlib # For capturing the tagger's error output when run in-process
+import io
+import functools
+import tempfile # Per-write temporary files for atomic saves
+
+# Optional: OpenCV's INTER_AREA downscale is faster than Pillow's LANCZOS for thumbnails.
+# Falls back to Pillow when OpenCV isn't installed.
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
 
 # Register the HEIF opener so Pillow can read HEIC files
 register_heif_opener()
 
+# Don't abort a whole batch on slightly truncated files or very large museum scans
+ImageFile.LOAD_TRUNCATED_IMAGES = True
+Image.MAX_IMAGE_PIXELS = None
+
 # --- Configuration for Tagger Script (ensure these match tagger.py) ---
 TAGGER_IMAGE_FOLDER_NAME = "Images" # The folder tagger.py looks for
 TAGGER_SCRIPT_NAME = "tagger.py"    # The name of your tagger script
 
+# --- Image extensions (lowercase, including the dot) ---
+SUPPORTED_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.heic', '.heif'})
+TIF_EXTS = frozenset({'.tif', '.tiff'})
+HEIC_EXTS = frozenset({'.heic', '.heif'})
+JPEG_EXTS = frozenset({'.jpg', '.jpeg'})
+
+# --- Pillow format names for the single-format conversions ---
+TIF_FORMATS = ("TIFF",)
+HEIC_FORMATS = ("HEIF",)
+
+# Strips an embedded image extension and any -tiny/-small suffix from a base name,
+# e.g. "TEMP.123.heic-small" -> "TEMP.123". The extension match is case-insensitive.
+_CLEAN_NAME_RE = re.compile(r'^(.*?)(?i:\.(?:heic|heif|tiff?|jpe?g|png|bmp))?(?:-tiny)?(?:-small)?\Z', re.DOTALL)
+
+# Set to False to always resize with Pillow even when OpenCV is available
+USE_OPENCV_RESIZE = cv2 is not None
+
+def _cuda_available():
+    """True if OpenCV was built with CUDA and can see at least one GPU."""
+    if cv2 is None:
+        return False
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+# Run with --gpu to resize thumbnails on a CUDA GPU. Needs an OpenCV build with CUDA;
+# without one this quietly stays on the CPU.
+USE_GPU_RESIZE = "--gpu" in sys.argv[1:] and _cuda_available()
+
+# mkstemp creates files readable only by their owner; outputs get the usual umask-based mode instead.
+# Read once here, as setting the umask isn't thread-safe.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Resampling filter for thumbnails, resolved once
+_LANCZOS = Image.Resampling.LANCZOS
+
+# Matches "TEMP_123" style base names for rename_temp_files
+_TEMP_NAME_RE = re.compile(r'(TEMP)_(\d+)', re.IGNORECASE)
+
+# --- JPEG encoder settings: explicit so a single encode pass is always used ---
+JPEG_SAVE_OPTIONS = {"quality": 85, "subsampling": 2, "optimize": False, "progressive": False}
+
+# --- Status label throttling: refresh at most every 100 ms, or every 25 files ---
+STATUS_UPDATE_INTERVAL = 0.1
+STATUS_UPDATE_EVERY = 25
+
+# How often (seconds) the result-collecting thread checks whether the window was closed
+POOL_POLL_INTERVAL = 0.25
+
+def _iter_files(root):
+    """
+    Recursively yields a DirEntry for every file under root. Uses os.scandir
+    so the file-type checks come from the directory listing instead of extra stat calls.
+    Like os.walk, symlinked files are included but symlinked folders aren't descended into.
+    Each folder is listed in full before anything is yielded, so callers may rename files as they go.
+    """
+    with os.scandir(root) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path)
+        elif entry.is_file():
+            yield entry
+
+def _load_renameat2():
+    """Returns libc's renameat2 on Linux (glibc 2.28+), or None if it isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+_renameat2 = _load_renameat2()
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+def _rename_noreplace(src, dst):
+    """
+    Renames src to dst, raising FileExistsError if dst already exists.
+    On Linux this is a single atomic renameat2(RENAME_NOREPLACE) call;
+    elsewhere (or on filesystems without support) it falls back to exists + rename.
+    """
+    if _renameat2 is not None:
+        if _renameat2(_AT_FDCWD, os.fsencode(src), _AT_FDCWD, os.fsencode(dst), _RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in (errno.EINVAL, errno.ENOSYS): # EINVAL/ENOSYS: flag not supported here
+            raise OSError(err, os.strerror(err), src, None, dst)
+
+    if os.path.exists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src, None, dst)
+    os.rename(src, dst)
+
+@functools.lru_cache(maxsize=8192) # Pure function of the path, so safe to memoize across runs
+def _get_cleaned_base_name(original_filepath):
+    """
+    Extracts the base name from a filepath and removes common suffixes
+    (-small, -tiny) and certain format extensions (like .heic, .tif)
+    if they are embedded in the base name itself.
+    """
+    name_without_ext = os.path.splitext(os.path.basename(original_filepath))[0]
+    return _CLEAN_NAME_RE.match(name_without_ext).group(1)
+
+def _opencv_resize(arr, size):
+    """Downscales a NumPy image with INTER_AREA, on the GPU when --gpu is enabled."""
+    if USE_GPU_RESIZE:
+        gpu_img = cv2.cuda_GpuMat()
+        gpu_img.upload(arr)
+        return cv2.cuda.resize(gpu_img, size, interpolation=cv2.INTER_AREA).download()
+    return cv2.resize(arr, size, interpolation=cv2.INTER_AREA)
+
+def _process_one(args):
+    """
+    Processes a single image file. Pillow releases the GIL while decoding,
+    resizing and encoding, so this runs in parallel on a thread pool.
+    Returns (ok, msg) where msg is a status line for the GUI.
+    """
+    file_path, output_dir, suffix, target_width, convert_to_jpg, formats = args
+    filename = os.path.basename(file_path)
+    original_file_ext = os.path.splitext(filename)[1].lower()
+
+    try:
+        # 1. Get the cleaned base name (e.g., "TEMP.123" from "TEMP_123.jpg")
+        cleaned_base_name = _get_cleaned_base_name(file_path)
+
+        # 2. Determine the final output extension
+        final_output_ext = ".jpg" if convert_to_jpg else original_file_ext
+
+        # 3. Construct the full desired output filename including suffix
+        output_filename = f"{cleaned_base_name}{suffix}{final_output_ext}"
+        output_filepath = os.path.join(output_dir, output_filename)
+
+        # Skip the decode/encode entirely if the output is already newer than the source
+        try:
+            if os.stat(output_filepath).st_mtime >= os.stat(file_path).st_mtime:
+                return True, f"Up to date: {os.path.basename(output_filepath)}"
+        except FileNotFoundError:
+            pass
+
+        # When the format is already known, skip sniffing every registered plugin
+        img = Image.open(file_path, formats=formats)
+
+        # For JPEGs, let the decoder downscale by 1/2, 1/4 or 1/8 while decoding.
+        # Asking for twice the target keeps enough detail for the LANCZOS resize below.
+        if target_width and original_file_ext in JPEG_EXTS:
+            img.draft('RGB', (target_width * 2, target_width * 2))
+
+        # Decode now, inside the worker thread, so decodes overlap across the pool
+        img.load()
+
+        # Resize if a target width is specified
+        if target_width:
+            original_width, original_height = img.size
+            if original_width > target_width: # Only resize if larger than target
+                new_height = int((target_width / original_width) * original_height)
+                if USE_OPENCV_RESIZE and img.mode in ("L", "RGB", "RGBA"):
+                    img = Image.fromarray(_opencv_resize(np.asarray(img), (target_width, new_height)))
+                else:
+                    img = img.resize((target_width, new_height), _LANCZOS)
+
+        # Encode into memory first, so the file is written with one contiguous write
+        buffer = io.BytesIO()
+        if final_output_ext == ".jpg": # If the target output format is JPG
+            if img.mode != "RGB": # Ensure it's in a format compatible with JPG
+                img = img.convert("RGB") # (skipped for RGB sources to avoid a full-image copy)
+            img.save(buffer, "jpeg", **JPEG_SAVE_OPTIONS)
+        else: # If keeping original format (e.g., if a future operation saves PNG as PNG)
+            # A buffer has no file extension, so pass the format explicitly
+            img.save(buffer, Image.registered_extensions()[final_output_ext])
+
+        # Write to a temporary file and move it into place, so an interrupted
+        # save never leaves a half-written image that looks up to date.
+        # Each write gets its own temp file: two inputs can map to the same output
+        # (e.g. X.tif next to X.jpg), and their workers must not share one.
+        fd, tmp_filepath = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.getbuffer())
+            os.chmod(tmp_filepath, 0o666 & ~_UMASK)
+            os.replace(tmp_filepath, output_filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filepath)
+            raise
+
+        return True, f"Processed: {filename} -> {os.path.basename(output_filepath)}"
+
+    except Exception as e:
+        return False, f"Error processing {filename}: {e}"
+
 class ImageProcessorApp:
     def __init__(self, master):
         self.master = master
@@ -20,10 +238,10 @@ class ImageProcessorApp:
 
         self.input_dir = ""
         self.output_dir = "ProcessedImages" # Default output directory
-
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        self._worker = None   # Background thread collecting results from the thread pool
+        self._executor = None # Thread pool of the current run; its queued files are cancelled on close
+        self._closing = False # Set once the window is closing, so the worker stops posting to Tk
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Labels and Entry for Input Directory
         self.label_input = tk.Label(master, text="Select Input Image Folder:")
@@ -58,6 +276,12 @@ class ImageProcessorApp:
         self.btn_rename_temp_files = tk.Button(master, text="Rename TEMP_XXX.ext to TEMP.XXX.ext", command=self.rename_temp_files)
         self.btn_rename_temp_files.grid(row=6, column=0, columnspan=3, pady=5)
 
+        # Disabled while the tagger window is open, so it can't be opened twice on the same
+        # Images/ folder and progress.json, nor have files processed underneath it
+        self._action_buttons = (self.btn_run_tagger, self.btn_create_tiny, self.btn_create_small,
+                                self.btn_convert_tif_to_jpg, self.btn_convert_heic_to_jpg,
+                                self.btn_rename_temp_files)
+
 
         # Status Label
         self.status_label = tk.Label(master, text="Status: Ready", fg="blue")
@@ -72,91 +296,95 @@ class ImageProcessorApp:
             self.entry_input.insert(0, self.input_dir)
             self.status_label.config(text=f"Status: Input directory set to {self.input_dir}", fg="blue")
 
-    def _get_cleaned_base_name(self, original_filepath):
-        """
-        Extracts the base name from a filepath and removes common suffixes
-        (-small, -tiny) and certain format extensions (like .heic, .tif)
-        if they are embedded in the base name itself.
-        """
-        base_name = os.path.basename(original_filepath)
-        name_without_ext, _ = os.path.splitext(base_name)
-
-        # Remove any existing -small or -tiny suffixes before applying new ones
-        if name_without_ext.endswith("-small"):
-            name_without_ext = name_without_ext[:-len("-small")]
-        if name_without_ext.endswith("-tiny"):
-            name_without_ext = name_without_ext[:-len("-tiny")]
-        
-        # Remove common image extensions if they somehow got into name_without_ext
-        current_name_lower = name_without_ext.lower()
-        for ext_to_remove in ('.heic', '.heif', '.tif', '.tiff', '.jpg', '.jpeg', '.png', '.bmp'):
-            if current_name_lower.endswith(ext_to_remove):
-                name_without_ext = name_without_ext[:-len(ext_to_remove)]
-                break
-                
-        return name_without_ext
-
-    def process_images(self, suffix, target_width=None, convert_to_jpg=False, specific_exts=None):
+    def process_images(self, suffix, target_width=None, convert_to_jpg=False, specific_exts=None, formats=None):
         if not self.input_dir:
             messagebox.showwarning("Warning", "Please select an input directory first.")
             return
 
-        supported_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.heic', '.heif')
-        processed_count = 0
-        skipped_count = 0
+        if self._worker is not None and self._worker.is_alive():
+            messagebox.showwarning("Warning", "Images are already being processed. Please wait for the current run to finish.")
+            return
 
         self.status_label.config(text="Status: Processing...", fg="orange")
         self.master.update_idletasks() # Update GUI immediately
 
-        for root, _, files in os.walk(self.input_dir):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                original_file_ext = os.path.splitext(filename)[1].lower()
-
-                if specific_exts and original_file_ext not in specific_exts:
-                    continue # Skip if specific extensions are required and doesn't match
-
-                if not specific_exts and original_file_ext not in supported_extensions:
-                    continue # Skip if not a supported image file (for general ops)
-
-                try:
-                    # 1. Get the cleaned base name (e.g., "TEMP.123" from "TEMP_123.jpg")
-                    cleaned_base_name = self._get_cleaned_base_name(file_path)
-
-                    # 2. Determine the final output extension
-                    final_output_ext = ".jpg" if convert_to_jpg else original_file_ext
-
-                    # 3. Construct the full desired output filename including suffix
-                    output_filename = f"{cleaned_base_name}{suffix}{final_output_ext}"
-                    output_filepath = os.path.join(self.output_dir, output_filename)
-
-                    img = Image.open(file_path)
-
-                    # Resize if a target width is specified
-                    if target_width:
-                        original_width, original_height = img.size
-                        if original_width > target_width: # Only resize if larger than target
-                            new_height = int((target_width / original_width) * original_height)
-                            img = img.resize((target_width, new_height), Image.LANCZOS)
+        # Collect the files to process up front so they can be handed to the thread pool
+        # Create the output directory only when it is first needed
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except OSError as e:
+            messagebox.showerror("Folder Creation Error", f"Could not create folder '{self.output_dir}': {e}")
+            self.status_label.config(text=f"Error creating folder: {e}", fg="red")
+            return
 
-                    # Save the image
-                    if final_output_ext == ".jpg": # If the target output format is JPG
-                        img = img.convert("RGB") # Ensure it's in a format compatible with JPG
-                        img.save(output_filepath, "jpeg")
-                    else: # If keeping original format (e.g., if a future operation saves PNG as PNG)
-                        img.save(output_filepath)
+        # Specific extensions if required, otherwise every supported image file (for general ops)
+        allowed_exts = specific_exts or SUPPORTED_EXTS
+        _splitext = os.path.splitext # Hoisted out of the per-file loop
+        tasks = [
+            (entry.path, self.output_dir, suffix, target_width, convert_to_jpg, formats)
+            for entry in _iter_files(self.input_dir)
+            if _splitext(entry.name)[1].lower() in allowed_exts
+        ]
+
+        # Queue every file on the pool, and collect the results from a background thread
+        # so mainloop keeps pumping. The pool is kept so closing the window can cancel it.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        futures = [self._executor.submit(_process_one, task) for task in tasks]
+        self._worker = threading.Thread(target=self._run_pool, args=(futures,), daemon=True)
+        self._worker.start()
+
+    def _run_pool(self, futures):
+        """
+        Runs in a background thread: collects the pool's results as they finish and
+        forwards them to the GUI. Tk is only ever touched via master.after().
+        """
+        processed_count = 0
+        skipped_count = 0
+        last_update = time.monotonic()
+
+        # Wait with a timeout rather than as_completed: futures cancelled by shutdown() never
+        # wake a waiter, so after the window closes this has to notice _closing by itself
+        pending = set(futures)
+        i = 0
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, timeout=POOL_POLL_INTERVAL, return_when=concurrent.futures.FIRST_COMPLETED)
+            if self._closing:
+                return # Window closed: the remaining files were cancelled
+            for future in done:
+                i += 1
+                ok, msg = future.result()
+                if ok:
+                    processed_count += 1
+                else:
+                    skipped_count += 1
 
+                # Only post a status update every so often, each one costs a Tk redraw
+                now = time.monotonic()
+                if now - last_update > STATUS_UPDATE_INTERVAL or i % STATUS_UPDATE_EVERY == 0:
+                    last_update = now
+                    if ok:
+                        self.master.after(0, lambda m=msg: self.status_label.config(text=m))
+                    else:
+                        self.master.after(0, lambda m=msg: self.status_label.config(text=m, fg="red"))
 
-                    self.status_label.config(text=f"Processed: {os.path.basename(file_path)} -> {os.path.basename(output_filepath)}")
-                    self.master.update_idletasks()
-                    processed_count += 1
+        self._executor.shutdown(wait=False)
+        if not self._closing:
+            self.master.after(0, self._finish_processing, processed_count, skipped_count)
 
-                except Exception as e:
-                    self.status_label.config(text=f"Error processing {filename}: {e}", fg="red")
-                    self.master.update_idletasks()
-                    skipped_count += 1
-                    # print(f"Error processing {file_path}: {e}") # For debugging
+    def _on_close(self):
+        """
+        Cancels any files still queued for processing, then closes the window.
+        Pool threads are joined at interpreter exit, so without this the process would
+        carry on invisibly until the whole batch was done. Files already being
+        processed still finish; their atomic writes never leave partial output.
+        """
+        self._closing = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
 
+    def _finish_processing(self, processed_count, skipped_count):
         messagebox.showinfo("Processing Complete",
                             f"Finished processing images.\nProcessed: {processed_count}\nSkipped (errors/unsupported): {skipped_count}")
         self.status_label.config(text="Status: Ready", fg="blue")
@@ -172,11 +400,11 @@ class ImageProcessorApp:
 
     def convert_tif_to_jpg(self):
         # Convert TIFs to JPGs, no special suffix for the conversion itself
-        self.process_images(suffix="", convert_to_jpg=True, specific_exts=['.tif', '.tiff'])
+        self.process_images(suffix="", convert_to_jpg=True, specific_exts=TIF_EXTS, formats=TIF_FORMATS)
 
     def convert_heic_to_jpg(self):
         # Convert HEICs to JPGs, no special suffix for the conversion itself
-        self.process_images(suffix="", convert_to_jpg=True, specific_exts=['.heic', '.heif'])
+        self.process_images(suffix="", convert_to_jpg=True, specific_exts=HEIC_EXTS, formats=HEIC_FORMATS)
 
 
     def rename_temp_files(self):
@@ -188,43 +416,44 @@ class ImageProcessorApp:
         skipped_count = 0
         self.status_label.config(text="Status: Renaming TEMP_ files...", fg="orange")
         self.master.update_idletasks()
+        last_update = time.monotonic()
+        # Hoisted out of the per-file loop
+        _splitext, _join, _dirname, _monotonic = os.path.splitext, os.path.join, os.path.dirname, time.monotonic
 
-        for root, _, files in os.walk(self.input_dir):
-            for filename in files:
-                name_without_ext, ext = os.path.splitext(filename)
-
-                # Check if the base name starts with "TEMP_" (case-insensitive)
-                # and if the part after "TEMP_" is purely digits.
-                if name_without_ext.lower().startswith("temp_"):
-                    potential_number_part = name_without_ext[len("temp_"):]
-                    
-                    if potential_number_part.isdigit():
-                        original_filepath = os.path.join(root, filename)
-                        
-                        # Replace the first underscore in the base name with a dot
-                        new_name_without_ext = name_without_ext.replace('_', '.', 1) # Replace only the first occurrence
-                        new_filename = new_name_without_ext + ext
-                        new_filepath = os.path.join(root, new_filename)
-
-                        try:
-                            # Avoid renaming if the file already exists with the new name
-                            if os.path.exists(new_filepath):
-                                print(f"Skipping rename for '{filename}': '{new_filename}' already exists.")
-                                skipped_count += 1
-                                continue
-
-                            os.rename(original_filepath, new_filepath)
-                            self.status_label.config(text=f"Renamed: {filename} -> {new_filename}")
-                            self.master.update_idletasks()
-                            renamed_count += 1
-                        except OSError as e:
-                            self.status_label.config(text=f"Error renaming {filename}: {e}", fg="red")
-                            self.master.update_idletasks()
-                            skipped_count += 1
-                    else:
-                        skipped_count += 1
-                else:
-                    skipped_count += 1
+        for i, entry in enumerate(_iter_files(self.input_dir), start=1):
+            filename = entry.name
+            name_without_ext, ext = _splitext(filename)
+
+            # Only rename base names of the form "TEMP_<digits>" (case-insensitive)
+            m = _TEMP_NAME_RE.fullmatch(name_without_ext)
+            if not m:
+                skipped_count += 1
+                continue
+
+            original_filepath = entry.path
+
+            # Replace the underscore with a dot, keeping the original case of "TEMP"
+            new_filename = f"{m.group(1)}.{m.group(2)}{ext}"
+            new_filepath = _join(_dirname(entry.path), new_filename)
+
+            try:
+                # Never overwrite: fails with FileExistsError if the new name is taken
+                _rename_noreplace(original_filepath, new_filepath)
+                renamed_count += 1
+                now = _monotonic()
+                if now - last_update > STATUS_UPDATE_INTERVAL or i % STATUS_UPDATE_EVERY == 0:
+                    last_update = now
+                    self.status_label.config(text=f"Renamed: {filename} -> {new_filename}")
+                    self.master.update_idletasks()
+            except FileExistsError:
+                print(f"Skipping rename for '{filename}': '{new_filename}' already exists.")
+                skipped_count += 1
+            except OSError as e:
+                # Always show errors straight away
+                self.status_label.config(text=f"Error renaming {filename}: {e}", fg="red")
+                self.master.update_idletasks()
+                last_update = _monotonic()
+                skipped_count += 1
 
         messagebox.showinfo("Renaming Complete",
                             f"Finished renaming files.\nRenamed: {renamed_count}\nSkipped: {skipped_count}")
@@ -234,17 +463,29 @@ class ImageProcessorApp:
         """
         Creates the IMAGE_FOLDER if it doesn't exist and then runs the tagger.py script.
         """
-        # 1. Create the IMAGE_FOLDER if it doesn't exist
-        if not os.path.exists(TAGGER_IMAGE_FOLDER_NAME):
-            try:
-                os.makedirs(TAGGER_IMAGE_FOLDER_NAME)
-                messagebox.showinfo("Folder Created", f"Created folder: '{TAGGER_IMAGE_FOLDER_NAME}'")
-            except Exception as e:
-                messagebox.showerror("Folder Creation Error", f"Could not create folder '{TAGGER_IMAGE_FOLDER_NAME}': {e}")
-                self.status_label.config(text=f"Error creating folder: {e}", fg="red")
-                return
+        # 1. Create the IMAGE_FOLDER if it doesn't exist (no separate exists check)
+        try:
+            os.makedirs(TAGGER_IMAGE_FOLDER_NAME)
+            messagebox.showinfo("Folder Created", f"Created folder: '{TAGGER_IMAGE_FOLDER_NAME}'")
+        except FileExistsError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Folder Creation Error", f"Could not create folder '{TAGGER_IMAGE_FOLDER_NAME}': {e}")
+            self.status_label.config(text=f"Error creating folder: {e}", fg="red")
+            return
 
-        # 2. Try to locate tagger.py
+        # 2. Prefer running the tagger in this process: no interpreter start-up,
+        #    and it shares this app's Tk mainloop. Fall back to a subprocess if it can't be imported.
+        try:
+            import tagger
+        except ImportError:
+            tagger = None
+
+        if tagger is not None:
+            self._run_tagger_in_process(tagger)
+            return
+
+        # 3. Try to locate tagger.py
         # When bundled with PyInstaller, sys.executable points to the bundled python interpreter
         # and scripts are often extracted to a temporary directory accessible relative to that.
         # This assumes tagger.py is in the same directory as this main script or its bundle entry.
@@ -289,6 +530,51 @@ class ImageProcessorApp:
             messagebox.showerror("An Unexpected Error Occurred", f"An unexpected error occurred while trying to run '{TAGGER_SCRIPT_NAME}': {e}")
             self.status_label.config(text=f"Error running {TAGGER_SCRIPT_NAME}: {e}", fg="red")
 
+    def _master_exists(self):
+        """False once the main window has been destroyed (winfo itself errors by then)."""
+        try:
+            return bool(self.master.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _run_tagger_in_process(self, tagger):
+        """
+        Opens the tagger as a window of this app and waits for it to close.
+        wait_window keeps the event loop pumping, so both windows stay responsive;
+        the buttons here are disabled meanwhile.
+        Anything the tagger writes to stderr (e.g. Tk callback tracebacks) is reported afterwards.
+        """
+        self.status_label.config(text=f"Status: Running '{TAGGER_SCRIPT_NAME}'...", fg="orange")
+        self.master.update_idletasks()
+
+        stderr_buffer = io.StringIO()
+        for button in self._action_buttons:
+            button.config(state=tk.DISABLED)
+        try:
+            with contextlib.redirect_stderr(stderr_buffer):
+                window = tagger.main(self.master)
+                if window.winfo_exists():
+                    self.master.wait_window(window)
+        except Exception as e:
+            messagebox.showerror("An Unexpected Error Occurred", f"An unexpected error occurred while trying to run '{TAGGER_SCRIPT_NAME}': {e}")
+            self.status_label.config(text=f"Error running {TAGGER_SCRIPT_NAME}: {e}", fg="red")
+            return
+        finally:
+            with contextlib.suppress(tk.TclError): # The main window may have been closed meanwhile
+                for button in self._action_buttons:
+                    button.config(state=tk.NORMAL)
+
+        if self._closing or not self._master_exists():
+            return # The whole app was closed, taking the tagger window with it
+
+        errors = stderr_buffer.getvalue()
+        if errors:
+            messagebox.showerror(f"{TAGGER_SCRIPT_NAME} Errors", f"Errors occurred in {TAGGER_SCRIPT_NAME}:\n{errors}")
+            self.status_label.config(text=f"'{TAGGER_SCRIPT_NAME}' finished with errors.", fg="red")
+        else:
+            messagebox.showinfo("Tagger Script Complete", f"'{TAGGER_SCRIPT_NAME}' executed successfully.")
+            self.status_label.config(text=f"Status: '{TAGGER_SCRIPT_NAME}' completed.", fg="blue")
+
 # Main part of the script
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,23 +1,134 @@
 import os
+import sys
 import json
+import re
+import io
+import csv
+import pickle
+import hashlib
+import importlib.util
 import tkinter as tk
-import shutil
 from tkinter import messagebox
 from PIL import Image, ImageTk
 import pandas as pd
 import tkinter.simpledialog as simpledialog
 import tkinter.ttk as ttk # Import ttk for the modern progress bar
+import threading
+import itertools
+import bisect
+import concurrent.futures
+from collections import OrderedDict, namedtuple
 
 EXCEL_FILE = "Object numbers.xlsx"
 IMAGE_FOLDER = "Images"
 PROGRESS_FILE = "progress.json"
+IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png"}) # Compared against the lowercased extension
+CACHE_DIR = ".cache" # Parsed-Excel cache lives here; safe to delete at any time
+DIMS_CACHE_FILE = os.path.join(CACHE_DIR, "dims.json") # filename -> [mtime_ns, size, width, height]
+IMAGE_CACHE_SIZE = 16 # Decoded images kept in memory for quick Next/Previous...
+IMAGE_CACHE_BYTES = 512 * 1024 * 1024 # ...as long as their pixels fit in this much memory
+LISTBOX_INSERT_CHUNK = 500 # Descriptions inserted into the listbox per idle callback
+
+# Case-insensitive comparison key for filenames. Every lookup table below is keyed on it,
+# so names are normalised once when stored rather than at each comparison.
+# (os.path.normcase would be a no-op on Linux, hence an explicit lowercase.)
+# Keys are interned like the filenames themselves, so lookups usually succeed on identity.
+def _name_key(filename):
+    return sys.intern(filename.lower())
+
+# Strings derived from an image's filename, worked out once per name rather than per check
+FileMeta = namedtuple("FileMeta", "name lower ext") # ext is lowercased, with the dot
+
+def _file_meta(filename):
+    return FileMeta(filename, _name_key(filename), os.path.splitext(filename)[1].lower())
+
+# Progress-bar status of each image, kept one byte per image in ImageTagger._status
+STATUS_PENDING, STATUS_RENAMED, STATUS_DONT_KNOW = 0, 1, 2
+STATUS_COLORS = ("gray", "blue", "red") # Progress-bar fill, indexed by status
+
+# Filename sanitizing for pasted rows: anything but letters, digits, space, '.', '-' and '_'
+# becomes '_', then runs of spaces/underscores collapse to a single '_'.
+# Object numbers are cleaned with the same class when tagging, with the characters dropped instead.
+_SANITIZE_RE = re.compile(r"[^\w .-]")
+_COLLAPSE_RE = re.compile(r"[_\s]+")
+
+# Use the much faster Rust-based calamine reader when python-calamine is installed
+# (pandas only knows it from 2.2 on; older versions fall back to the default reader)
+EXCEL_READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+# Likewise xlsxwriter for saving imports; without it openpyxl's write-only mode is used
+EXCEL_WRITE_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else None
 
 # ────────────────────────────────────────────────────────────
 # Helpers for Excel + progress JSON
 # ────────────────────────────────────────────────────────────
 
+def _excel_cache_path():
+    """Path of the pickled copy of the parsed Excel file, e.g. .cache/Object_numbers.<hash>.pkl"""
+    name = os.path.splitext(os.path.basename(EXCEL_FILE))[0].replace(" ", "_")
+    digest = hashlib.sha1(os.path.abspath(EXCEL_FILE).encode()).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{name}.{digest}.pkl")
+
+# Part of the cache key: bump when the parsed values change, so older caches are re-read
+EXCEL_CACHE_FORMAT = 2
+
+# (path, key, descriptions_list, description_data) from the last load in this process,
+# so reopening the tagger from processimages.py doesn't even unpickle again
+_loaded_excel = None
+
+def _invalidate_excel_cache():
+    global _loaded_excel
+    _loaded_excel = None
+    try:
+        os.remove(_excel_cache_path())
+    except FileNotFoundError:
+        pass
+
 def load_descriptions_from_excel():
-    df = pd.read_excel(EXCEL_FILE)
+    """
+    Returns (descriptions_list, description_data). Parsing the workbook is slow, so the
+    result is pickled to CACHE_DIR and reused until the Excel file's mtime or size changes.
+    Within one process the parsed result is also kept in memory on the same terms.
+    """
+    global _loaded_excel
+    st = os.stat(EXCEL_FILE)
+    key = f"{EXCEL_CACHE_FORMAT}-{st.st_mtime_ns}-{st.st_size}"
+    path = os.path.abspath(EXCEL_FILE)
+    if _loaded_excel is not None and _loaded_excel[:2] == (path, key):
+        return _loaded_excel[2], _loaded_excel[3]
+    cache_path = _excel_cache_path()
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, descriptions_list, description_data = pickle.load(f)
+        if cached_key == key:
+            _loaded_excel = (path, key, descriptions_list, description_data)
+            return descriptions_list, description_data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass # Missing or unreadable cache, just re-read the Excel file
+
+    descriptions_list, description_data = _read_descriptions_from_excel()
+    _loaded_excel = (path, key, descriptions_list, description_data)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, descriptions_list, description_data), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass # Caching is only an optimisation
+
+    return descriptions_list, description_data
+
+def _read_descriptions_from_excel():
+    # Values keep pandas' type inference: numbers are stored as str(value) (e.g. '1.0'), and
+    # used_tags in existing progress files and the tag filenames depend on that
+    try:
+        df = pd.read_excel(EXCEL_FILE, engine=EXCEL_READ_ENGINE)
+    except (ValueError, ImportError):
+        if EXCEL_READ_ENGINE is None:
+            raise
+        df = pd.read_excel(EXCEL_FILE) # This pandas doesn't support calamine
     df.columns = df.columns.str.strip() # Clean column names
     
     # Ensure all expected columns exist, fill missing with empty strings
@@ -29,25 +140,79 @@ def load_descriptions_from_excel():
         if col not in df.columns:
             df[col] = '' # Add missing columns as empty strings/NaN
 
+    # Clean every needed column in one vectorised pass: str() of each value, NaN -> '', strip.
+    # map(str) rather than astype(str), which formats whole date columns differently.
+    cols = df[expected_cols].apply(lambda col: col.map(str, na_action='ignore').fillna('').str.strip())
+
     # Filter out rows where 'Description' is empty or NaN
-    df = df[df["Description"].notna() & (df["Description"].astype(str).str.strip() != '')]
-
-    # Convert to list of dictionaries for easier lookup
-    description_data = {}
-    for _, row in df.iterrows():
-        # Ensure the key itself is stripped when creating the dictionary
-        stripped_desc_key = str(row["Description"]).strip()
-        description_data[stripped_desc_key] = {
-            "Object Number": str(row["Object Number"]).strip() if pd.notna(row["Object Number"]) else '',
-            "Sticker Number": str(row["Sticker Number"]).strip() if pd.notna(row["Sticker Number"]) else '',
-            "Imported Description": str(row["Imported Description"]).strip() if pd.notna(row["Imported Description"]) else '',
-            "Location": str(row["Location"]).strip() if pd.notna(row["Location"]) else ''
-        }
-    
+    cols = cols[cols["Description"] != '']
+
+    # Build the lookup keyed on the (stripped) description
+    keys = cols["Description"].tolist()
+    records = cols[["Object Number", "Sticker Number", "Imported Description", "Location"]].to_dict(orient="records")
+    description_data = dict(zip(keys, records))
+
     # The descriptions_list will now contain the cleaned keys
     descriptions_list = list(description_data.keys())
     return descriptions_list, description_data
 
+def _write_descriptions_to_excel(df):
+    """
+    Saves df to EXCEL_FILE with a streaming writer, so large imports don't build the
+    whole workbook in memory: xlsxwriter if installed, else openpyxl in write-only mode.
+    """
+    if EXCEL_WRITE_ENGINE:
+        with pd.ExcelWriter(EXCEL_FILE, engine=EXCEL_WRITE_ENGINE) as writer:
+            df.to_excel(writer, index=False)
+        return
+
+    from openpyxl import Workbook # Already required by pandas for reading .xlsx
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(EXCEL_FILE)
+
+def _snapshot_folder():
+    """Names of the image files currently in IMAGE_FOLDER, from a single directory scan."""
+    with os.scandir(IMAGE_FOLDER) as it:
+        return {sys.intern(e.name) for e in it if os.path.splitext(e.name)[1].lower() in IMAGE_EXTS and e.is_file()}
+
+def _load_dims_cache():
+    """Returns the saved image dimensions, {filename: (mtime_ns, size, width, height)}."""
+    try:
+        with open(DIMS_CACHE_FILE, "r") as f:
+            return {name: tuple(entry) for name, entry in json.load(f).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {} # Missing or unreadable cache; sizes are re-read as images are shown
+
+_IMAGE_PREFIX = os.path.join(IMAGE_FOLDER, "") # "Images/", separator included
+
+def _image_path(filename):
+    """Path of a file in IMAGE_FOLDER. The folder never changes, so this is a plain concatenation."""
+    return _IMAGE_PREFIX + filename
+
+def _file_stamp(filename):
+    """(mtime_ns, size) of a file in IMAGE_FOLDER; cached data for it is valid while this matches."""
+    st = os.stat(_image_path(filename))
+    return (st.st_mtime_ns, st.st_size)
+
+def _image_bytes(img):
+    """Approximate memory held by a decoded image's pixels."""
+    return img.width * img.height * len(img.getbands())
+
+def _decode_image(path, draft_size=None):
+    """
+    Opens and decodes an image. With draft_size, JPEGs are decoded by libjpeg at 1/2, 1/4
+    or 1/8 scale straight away, as long as the result still covers draft_size.
+    """
+    img = Image.open(path)
+    if draft_size:
+        img.draft("RGB", draft_size) # No-op for PNGs
+    img.load()
+    return img
+
 def load_progress():
     if os.path.exists(PROGRESS_FILE):
         with open(PROGRESS_FILE, "r") as f:
@@ -71,7 +236,7 @@ class ImageTagger:
     ZOOM_MAX = 10.0    # 1000%
     ZOOM_STEP = 1.2    # 20% per key-press / tick
 
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk | tk.Toplevel):
         self.root = root
         self.root.title("Museum Image Tagger")
         self.root.geometry("1100x800")
@@ -81,30 +246,33 @@ class ImageTagger:
 
         p = load_progress()
         self.used_tags = set(p["used_tags"])
-        self.renamed_files = p["renamed"]
+        # Filenames are interned: the same name from progress.json, the folder scan and the
+        # lookup tables is then one shared object, and set/dict hits compare by identity
+        self.renamed_files = {sys.intern(old): sys.intern(new) for old, new in p["renamed"].items()}
+        self._rebuild_rename_lookups()
         self.current_index = p["index"]
-        self.dont_know_files = set(p["dont_know_files"]) # Initialize new set
+        self.dont_know_files = set(map(sys.intern, p["dont_know_files"])) # Initialize new set
 
-        # Load initial image files, prioritizing saved order if available
-        initial_disk_files = sorted(
-            f for f in os.listdir(IMAGE_FOLDER)
-            if f.lower().endswith((".jpg", ".jpeg", ".png"))
-        )
+        # Load initial image files, prioritizing saved order if available.
+        # One directory scan; existence checks below are set lookups instead of a stat per file.
+        self._folder_files = _snapshot_folder()
 
         if p.get("image_files_order") and len(p["image_files_order"]) > 0:
             # Reconstruct saved order, filtering out missing files and adding new ones
-            saved_order = p["image_files_order"]
+            saved_order = map(sys.intern, p["image_files_order"])
             # Keep files in saved_order that actually exist
-            existing_saved_files = [f for f in saved_order if os.path.exists(os.path.join(IMAGE_FOLDER, f))]
+            existing_saved_files = [f for f in saved_order if f in self._folder_files]
             # Add any new files from disk that weren't in the saved order, sorted alphabetically at the end
-            new_disk_files = sorted([f for f in initial_disk_files if f not in existing_saved_files])
+            existing_saved_set = set(existing_saved_files)
+            new_disk_files = sorted(f for f in self._folder_files if f not in existing_saved_set)
             self.image_files = existing_saved_files + new_disk_files
             # Ensure current_index is valid for the reloaded list
             if self.current_index >= len(self.image_files):
                 self.current_index = 0 if len(self.image_files) > 0 else 0
         else:
-            # No saved order, use initial disk order
-            self.image_files = initial_disk_files
+            # No saved order, use alphabetical disk order
+            self.image_files = sorted(self._folder_files)
+        self._rebuild_file_meta()
 
         if not self.image_files:
             messagebox.showerror("No images found", "Put images in the Images/ folder first.")
@@ -142,8 +310,8 @@ class ImageTagger:
         yscroll.config(command=self.listbox.yview)
         yscroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.listbox.pack()
-        for d in self.descriptions:
-            self.listbox.insert(tk.END, d)
+        self._insert_after_id = None # pending chunked listbox insert
+        self._populate_listbox()
 
         btn = lambda t, c: tk.Button(right, text=t, command=c).pack(fill=tk.X, pady=1)
         btn("←  Previous",          self.prev_image)
@@ -169,12 +337,46 @@ class ImageTagger:
         self.zoom = 1.0    # effective scale (1 = original pixels)
         self.offset = [0.0, 0.0]     # top-left image corner in canvas coords
         self.drag_start = None       # (x,y) while dragging
+        self.tk_img = None           # PhotoImage currently shown, reused between renders
+        self._canvas_img_id = None   # canvas item showing tk_img
+        self._rendered_size = None   # (w, h) of the pixels currently in tk_img
+        self._preview_img: Image.Image | None = None # downsampled copy of original_img
+        # filename -> ((mtime_ns, size), decoded image), least recently used first
+        self._img_cache: OrderedDict[str, tuple[tuple[int, int], Image.Image]] = OrderedDict()
+        self._img_cache_bytes = 0
+        self._img_stamp = None # (mtime_ns, size) of the current image file
+        self._img_cache_lock = threading.Lock()
+        # Background decoding: the displayed image and the prefetch of its neighbours
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._display_generation = 0 # Bumped per display_image; stale decodes are dropped
+        self._full_load_generation = -1 # _display_generation a full-resolution decode was last requested for
+        self._loading_text_id = None # "Loading…" placeholder on the canvas
+        self._save_after_id = None   # pending debounced progress save
+        self._img_size = (0, 0)      # full-resolution (w, h) of the current image
+        self._dim_cache = _load_dims_cache()
+        self._dim_cache_dirty = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._current_highlight_id = None # progress canvas item outlining the current image
+        self._drawn_progress = None       # (width, height, statuses) last drawn on the progress canvas
+        self._resize_after_id = None      # pending debounced progress redraw after a resize
+        self._display_after_id = None     # pending display_image after a progress-bar click
+        self._refresh_after_id = None     # pending idle display_image after navigation or tagging
+        self._zooming = False             # True between zoom steps; renders use BILINEAR meanwhile
+        self._zoom_settle_id = None       # pending LANCZOS re-render once zooming stops
+        self._fit_after_id = None         # pending _fit_to_window retry while the canvas has no size yet
+        self._closed = False              # Set once _on_destroy has flushed and cancelled everything
 
         # ── event bindings -----------------------------------------
+        # Bound on this window rather than bind_all: as a Toplevel of processimages.py,
+        # app-wide bindings would outlive the window (and keep this tagger alive)
         for seq in ("<Control-plus>", "<Control-KP_Add>", "<Control-equal>"):
-            root.bind_all(seq, lambda e: self.zoom_relative(self.ZOOM_STEP))
+            self.root.bind(seq, lambda e: self.zoom_relative(self.ZOOM_STEP))
         for seq in ("<Control-minus>", "<Control-KP_Subtract>"):
-            root.bind_all(seq, lambda e: self.zoom_relative(1/self.ZOOM_STEP))
+            self.root.bind(seq, lambda e: self.zoom_relative(1/self.ZOOM_STEP))
+
+        self.root.bind("<FocusIn>", self._prune_missing) # Catch files deleted while the app was in the background
+        # Not only WM_DELETE_WINDOW: closing processimages.py destroys a Toplevel tagger without asking it
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
 
         self.canvas.bind("<ButtonPress-1>", self._start_pan)
         self.canvas.bind("<B1-Motion>",       self._do_pan)
@@ -189,11 +391,78 @@ class ImageTagger:
         # first image ----------------------------------------------
         self.display_image()
 
+    # ────────────────────────────────────────────────────────────
+    # Rename lookups
+    # ────────────────────────────────────────────────────────────
+    def _rebuild_rename_lookups(self):
+        """
+        Rebuilds the lowercased lookups derived from renamed_files, so status checks and
+        "what was this called before?" are dict/set lookups instead of scans.
+        Call after loading or replacing renamed_files; single renames and undos patch
+        the lookups in place.
+        """
+        self._new_to_old = {} # lowercased new name -> original name
+        self._renamed_originals_lc = set()
+        for old, new in self.renamed_files.items():
+            old_key, new_key = _name_key(old), _name_key(new)
+            self._new_to_old.setdefault(new_key, old) # First match wins, as the old scans did
+            if old_key != new_key: # Original names only count if the rename actually changed the name
+                self._renamed_originals_lc.add(old_key)
+
+    def _rebuild_file_meta(self):
+        """
+        Rebuilds _meta and _status, the FileMeta and status twins of image_files used for
+        the checks above. Call after replacing image_files; single edits update all three in step.
+        """
+        self._meta = list(map(_file_meta, self.image_files))
+        self._rebuild_status()
+
+    def _rebuild_status(self):
+        """
+        Recomputes every image's progress status. Only needed when a change can affect
+        images other than the current one; otherwise _recolor_block updates its one byte.
+        """
+        self._status = bytearray(map(self._block_status, range(len(self.image_files))))
+
+    def _prune_missing(self, event=None):
+        """
+        Rescans IMAGE_FOLDER once and drops list entries whose files have gone, e.g. deleted
+        in a file manager. Runs when the window regains focus, so navigation never has to
+        hunt past a long stretch of missing files.
+        """
+        if event is not None and event.widget is not self.root:
+            return # <FocusIn> on the window also fires for each child widget
+        self._folder_files = _snapshot_folder()
+        keep = [i for i, f in enumerate(self.image_files) if f in self._folder_files]
+        if len(keep) == len(self.image_files):
+            return
+
+        # Stay on the same image, or the next surviving one if it was deleted
+        new_index = bisect.bisect_left(keep, self.current_index)
+        current_kept = new_index < len(keep) and keep[new_index] == self.current_index
+        self.image_files = [self.image_files[i] for i in keep]
+        self._meta = [self._meta[i] for i in keep]
+        self._status = bytearray(self._status[i] for i in keep)
+        self.current_index = min(new_index, max(len(keep) - 1, 0))
+        self._schedule_save()
+        if current_kept:
+            self._update_counter()
+            self._draw_progress_blocks()
+        else:
+            self.display_image()
+
     # ────────────────────────────────────────────────────────────
     # Save progress method
     # ────────────────────────────────────────────────────────────
     def save_progress(self):
-        """Saves the current state of the application to a JSON file."""
+        """
+        Saves the current state of the application to a JSON file, straight away.
+        Written to a temp file and swapped in, so a crash mid-write can't corrupt progress.
+        """
+        if self._save_after_id: # This write supersedes any pending debounced one
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
         data = {
             "used_tags": list(self.used_tags),
             "renamed": self.renamed_files,
@@ -201,8 +470,63 @@ class ImageTagger:
             "image_files_order": self.image_files, # Save the current order
             "dont_know_files": list(self.dont_know_files)
         }
-        with open(PROGRESS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = PROGRESS_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":")) # Compact: no indent, it roughly doubles the size
+        os.replace(tmp_path, PROGRESS_FILE)
+        self._save_dims_cache()
+
+    def _save_dims_cache(self):
+        """Writes the image dimensions cache if it changed, dropping files no longer in the folder."""
+        if not self._dim_cache_dirty:
+            return
+        self._dim_cache = {name: entry for name, entry in self._dim_cache.items() if name in self._folder_files}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = DIMS_CACHE_FILE + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._dim_cache, f, separators=(",", ":"))
+            os.replace(tmp_path, DIMS_CACHE_FILE)
+            self._dim_cache_dirty = False
+        except OSError:
+            pass # Caching is only an optimisation
+
+    def _schedule_save(self):
+        """
+        Saves progress once things go quiet for 500 ms, so rapid navigation doesn't write on every click.
+        Only for navigation and "don't know" changes: anything that renames a file or records
+        a tag calls save_progress straight away, so progress.json never lags behind the disk.
+        """
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._do_save)
+
+    def _do_save(self):
+        self._save_after_id = None
+        self.save_progress()
+
+    def _on_close(self):
+        """Closes the window; _on_destroy then writes any pending progress."""
+        self.root.destroy()
+
+    def _on_destroy(self, event):
+        """
+        Writes any pending progress as the window is destroyed, however that happens, and
+        cancels queued work. As a Toplevel, the window's after callbacks would otherwise
+        outlive it and fire on destroyed widgets.
+        """
+        if str(event.widget) != str(self.root) or self._closed:
+            return # <Destroy> on the window also fires for each child widget
+        self._closed = True
+        if self._save_after_id:
+            self.save_progress()
+        self._save_dims_cache()
+        for after_id in (self._refresh_after_id, self._display_after_id, self._resize_after_id,
+                         self._zoom_settle_id, self._insert_after_id, self._fit_after_id):
+            if after_id:
+                self.root.after_cancel(after_id)
+        self._display_generation += 1 # Decodes still in flight are dropped when they land
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     # ────────────────────────────────────────────────────────────
     # Import object descriptions
@@ -269,7 +593,8 @@ class ImageTagger:
 
         # Save the new DataFrame to Excel, effectively overwriting the old content
         try:
-            df_to_save.to_excel(EXCEL_FILE, index=False)
+            _write_descriptions_to_excel(df_to_save)
+            _invalidate_excel_cache()
             messagebox.showinfo("Success", f"Imported {len(rows)} rows and updated {EXCEL_FILE}.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save {EXCEL_FILE}:\n{e}")
@@ -280,20 +605,18 @@ class ImageTagger:
         self.descriptions, self.description_data = load_descriptions_from_excel()
 
         # Clear existing listbox items and insert new ones
-        self.listbox.delete(0, tk.END)
-        for d in self.descriptions:
-            self.listbox.insert(tk.END, d)
+        self._populate_listbox()
 
         # Reset used tags and renamed files as the source data has changed
         self.used_tags.clear()
         self.renamed_files.clear()
+        self._rebuild_rename_lookups()
         self.dont_know_files.clear() # Clear "don't know" flags
 
         # Re-scan image folder to set initial image_files order to current alphabetical disk order
-        self.image_files = sorted(
-            f for f in os.listdir(IMAGE_FOLDER)
-            if f.lower().endswith((".jpg", ".jpeg", ".png"))
-        )
+        self._folder_files = _snapshot_folder()
+        self.image_files = sorted(self._folder_files)
+        self._rebuild_file_meta()
         self.current_index = 0 if self.image_files else 0 # Reset current image index
 
         self._update_list_colors()
@@ -317,59 +640,55 @@ class ImageTagger:
             """Sanitizes text to be suitable for a filename part."""
             if not isinstance(text, str):
                 return ""
-            # Replace common problematic characters with underscore
             # Keep alphanumeric, spaces, hyphens, and dots. Replace others with _
-            sanitized = "".join(c if c.isalnum() or c in (' ', '-', '_', '.') else '_' for c in text).strip()
-            # Replace multiple spaces/underscores with a single underscore
-            sanitized = '_'.join(filter(None, sanitized.split())) # Handles spaces, and ensures single underscores
-            sanitized = '_'.join(filter(None, sanitized.split('_'))) # Handles existing underscores
-            return sanitized
+            sanitized = _SANITIZE_RE.sub('_', text)
+            # Replace runs of spaces/underscores with a single underscore
+            return _COLLAPSE_RE.sub('_', sanitized).strip('_')
 
 
-        rows = []
+        # Rows are stripped and blank ones dropped, as before, then parsed in one go by pandas.
+        # The separator is chosen once for the whole paste: tab if any tab is present, else comma.
         lines = [line.strip() for line in raw_text.strip().splitlines() if line.strip()]
-        for line in lines:
-            # Try tab split first, else comma
-            if "\t" in line:
-                parts = line.split("\t")
-            else:
-                parts = line.split(",")
-
-            # Must have at least enough columns for all required indices (index 20 = Col U)
-            if len(parts) <= 20:  
-                continue
-
-            # Extract data, handling potential empty strings for non-mandatory fields
-            sticker_num = parts[2].strip() if len(parts) > 2 else ''
-            desc = parts[3].strip() if len(parts) > 3 else ''
-            obj_num = parts[15].strip() if len(parts) > 15 else ''
-            imported_desc = parts[16].strip() if len(parts) > 16 else ''
-            loc = parts[20].strip() if len(parts) > 20 else ''
-
-            if not desc: # Description (D) is mandatory for a valid entry
-                continue
-
-            # Fallback logic for Object Number if empty
-            if not obj_num:
+        if not lines:
+            return []
+        sep = "\t" if any("\t" in line for line in lines) else ","
+        # Must have at least enough columns for all required indices (index 20 = Col U)
+        lines = [line for line in lines if line.count(sep) >= 20]
+        if not lines:
+            return []
+        width = max(line.count(sep) for line in lines) + 1
+
+        df = pd.read_csv(
+            io.StringIO("\n".join(lines)), sep=sep, header=None, names=range(width),
+            dtype=str, keep_default_na=False, quoting=csv.QUOTE_NONE, engine="c",
+        )
+
+        columns = {
+            'Sticker Number': 2,
+            'Description': 3,
+            'Object Number': 15,
+            'Imported Description': 16,
+            'Location': 20,
+        }
+        parsed = pd.DataFrame({name: df[i].str.strip() for name, i in columns.items()})
+        parsed = parsed[parsed['Description'] != ''] # Description (D) is mandatory for a valid entry
+
+        # Fallback logic for Object Number if empty; only the rows that need it are sanitized
+        missing = parsed['Object Number'] == ''
+        if missing.any():
+            fallbacks = []
+            for desc, loc in zip(parsed.loc[missing, 'Description'], parsed.loc[missing, 'Location']):
                 sanitized_fallback_desc = sanitize_for_filename(desc) # Sanitize description for filename
                 sanitized_fallback_loc = sanitize_for_filename(loc)   # Sanitize location for filename
 
                 if sanitized_fallback_loc and sanitized_fallback_desc:
-                    obj_num = f"{sanitized_fallback_loc}_{sanitized_fallback_desc}"
-                elif sanitized_fallback_loc:
-                    obj_num = sanitized_fallback_loc
-                elif sanitized_fallback_desc:
-                    obj_num = sanitized_fallback_desc
+                    fallbacks.append(f"{sanitized_fallback_loc}_{sanitized_fallback_desc}")
                 else:
-                    obj_num = "Unknown_Object" # Generic fallback if both are empty
-
-            rows.append({
-                'Description': desc,
-                'Object Number': obj_num, # This is now the sanitized fallback or original object number
-                'Sticker Number': sticker_num,
-                'Imported Description': imported_desc,
-                'Location': loc
-            })
+                    # Generic fallback if both are empty
+                    fallbacks.append(sanitized_fallback_loc or sanitized_fallback_desc or "Unknown_Object")
+            parsed.loc[missing, 'Object Number'] = fallbacks
+
+        rows = parsed[['Description', 'Object Number', 'Sticker Number', 'Imported Description', 'Location']].to_dict("records")
         return rows
         
     # ────────────────────────────────────────────────────────────
@@ -382,8 +701,8 @@ class ImageTagger:
             # Get the index of the clicked item
             index = self.listbox.nearest(event.y)
             # Ensure the index is valid
-            if 0 <= index < len(self.descriptions):
-                selected_desc_raw = self.listbox.get(index)
+            if 0 <= index < len(self._desc_tuple):
+                selected_desc_raw = self._desc_tuple[index] # Same text as the row, without a Tcl round trip
                 selected_desc = selected_desc_raw.strip() # <--- Crucial: Strip whitespace from listbox selection
 
                 details = self.description_data.get(selected_desc) # Use the stripped version for lookup
@@ -461,142 +780,453 @@ class ImageTagger:
         new_index = max(0, min(total_images - 1, new_index))
         
         self.current_index = new_index
-        self.display_image()
-        self.save_progress() # Call the now-existing instance method
+        # Move the outline and counter straight away, but only decode the image once the
+        # clicks stop, so skimming along the bar doesn't load every image on the way
+        self._refresh_highlight()
+        self._update_counter()
+        if self._display_after_id:
+            self.root.after_cancel(self._display_after_id)
+        self._display_after_id = self.root.after(150, self.display_image)
+        self._schedule_save()
 
     def _on_progress_canvas_configure(self, event):
-        """Redraws the progress blocks when the canvas is resized."""
+        """
+        Redraws the progress blocks when the canvas is resized. A drag-resize fires
+        <Configure> for every pixel, so the redraw is debounced to once the resizing pauses.
+        """
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._redraw_after_resize)
+
+    def _redraw_after_resize(self):
+        self._resize_after_id = None
         self._draw_progress_blocks()
 
-    def _draw_progress_blocks(self):
-        """Draws individual blocks on the progress canvas representing image statuses."""
-        self.progress_canvas.delete("all") # Clear existing drawings
+    def _block_status(self, index):
+        """Works out one image's progress status from the rename and "don't know" records."""
+        if self.image_files[index] in self.dont_know_files: # dont_know_files stores actual filenames, so exact match is fine
+            return STATUS_DONT_KNOW
+
+        # Renamed if the file is a new name, or an original name that was renamed
+        # (compared lowercased for Windows case-insensitivity)
+        filename_lc = self._meta[index].lower
+        if filename_lc in self._new_to_old or filename_lc in self._renamed_originals_lc:
+            return STATUS_RENAMED
+        return STATUS_PENDING
 
+    def _draw_progress_blocks(self):
+        """
+        Draws the progress canvas: one rectangle per run of same-coloured images, plus a
+        yellow outline for the current image. If no statuses changed and the canvas wasn't
+        resized, only the outline is moved.
+        """
         canvas_width = self.progress_canvas.winfo_width()
         canvas_height = self.progress_canvas.winfo_height()
         total_images = len(self.image_files)
 
         if total_images == 0 or canvas_width == 0 or canvas_height == 0:
+            self.progress_canvas.delete("all") # Clear existing drawings
+            self._current_highlight_id = None
+            self._drawn_progress = None
             return
 
-        block_width = canvas_width / total_images
+        statuses = self._status
+        drawn = (canvas_width, canvas_height, bytearray(statuses)) # A copy, for _recolor_block to compare against
+        if drawn == self._drawn_progress and self._current_highlight_id is not None:
+            self._refresh_highlight()
+            return
 
-        for i, filename in enumerate(self.image_files):
-            x1 = i * block_width
-            x2 = (i + 1) * block_width
-            
-            fill_color = "gray" # Default for untagged
-            outline_color = "" # No outline by default
-            line_width = 1
-
-            # Check if original filename is in renamed_files values, or if new filename is a key
-            is_renamed = False
-            for original_name, new_name in self.renamed_files.items():
-                # For Windows case-insensitivity: compare lowercased versions for existing files
-                if filename.lower() == new_name.lower(): # current file is a new name
-                    is_renamed = True
-                    break
-                if filename.lower() == original_name.lower() and new_name.lower() != original_name.lower(): # current file is an original name that was renamed
-                    is_renamed = True
-                    break
-
-            if is_renamed:
-                fill_color = "blue"
-            
-            if filename in self.dont_know_files: # dont_know_files stores actual filenames, so exact match is fine
-                fill_color = "red"
-            
-            if i == self.current_index:
-                outline_color = "yellow"
-                line_width = 2 # Thicker outline for current image
+        self.progress_canvas.delete("all") # Clear existing drawings
+        block_width = canvas_width / total_images
 
-            self.progress_canvas.create_rectangle(x1, 0, x2, canvas_height, 
-                                                    fill=fill_color, outline=outline_color, width=line_width)
+        # Merge consecutive blocks of the same colour into a single rectangle
+        self._run_starts = [] # first image index of each rectangle, for _recolor_block
+        self._run_items = []  # canvas item of each rectangle
+        run_start = 0
+        for i in range(1, total_images + 1):
+            if i == total_images or statuses[i] != statuses[run_start]:
+                self._run_starts.append(run_start)
+                self._run_items.append(self.progress_canvas.create_rectangle(
+                    run_start * block_width, 0, i * block_width, canvas_height,
+                    fill=STATUS_COLORS[statuses[run_start]], outline=""))
+                run_start = i
+
+        # Thicker outline for current image, drawn last so it sits on top
+        self._current_highlight_id = self.progress_canvas.create_rectangle(0, 0, 0, 0, outline="yellow", width=2)
+        self._drawn_progress = drawn
+        self._refresh_highlight()
+
+    def _recolor_block(self, index):
+        """
+        Updates the progress bar after one image's status changed, refreshing its byte in
+        _status first. Only the rectangle covering
+        that image is touched: recoloured if it covers just this image, otherwise split around it.
+        Split runs aren't re-merged until the next full redraw.
+        """
+        self._status[index] = self._block_status(index)
+        if self._drawn_progress is None or self._current_highlight_id is None:
+            self._draw_progress_blocks()
+            return
+        canvas_width, canvas_height, drawn_statuses = self._drawn_progress
+        if len(drawn_statuses) != len(self.image_files):
+            self._draw_progress_blocks()
+            return
+        old_status, new_status = drawn_statuses[index], self._status[index]
+        if new_status == old_status:
+            return
+        old_color, new_color = STATUS_COLORS[old_status], STATUS_COLORS[new_status]
+
+        run = bisect.bisect_right(self._run_starts, index) - 1
+        start = self._run_starts[run]
+        end = self._run_starts[run + 1] if run + 1 < len(self._run_starts) else len(drawn_statuses)
+        pieces = [(a, b, c) for a, b, c in ((start, index, old_color), (index, index + 1, new_color),
+                                             (index + 1, end, old_color)) if a < b]
+        # Reuse the run's rectangle for the first piece; new ones go just under the yellow outline
+        items = [self._run_items[run]] + [
+            self.progress_canvas.create_rectangle(0, 0, 0, 0, outline="") for _ in pieces[1:]
+        ]
+        block_width = canvas_width / len(drawn_statuses)
+        for item, (a, b, fill) in zip(items, pieces):
+            self.progress_canvas.coords(item, a * block_width, 0, b * block_width, canvas_height)
+            self.progress_canvas.itemconfig(item, fill=fill)
+            self.progress_canvas.tag_lower(item, self._current_highlight_id)
+        self._run_starts[run:run + 1] = [a for a, _, _ in pieces]
+        self._run_items[run:run + 1] = items
+        drawn_statuses[index] = new_status
+
+    def _refresh_highlight(self):
+        """Moves the current-image outline on the progress canvas without redrawing the blocks."""
+        total_images = len(self.image_files)
+        if self._current_highlight_id is None or total_images == 0:
+            return
+        block_width = self.progress_canvas.winfo_width() / total_images
+        x1 = self.current_index * block_width
+        self.progress_canvas.coords(self._current_highlight_id, x1, 0, x1 + block_width, self.progress_canvas.winfo_height())
 
 
     # ────────────────────────────────────────────────────────────
     # Image display helpers
     # ────────────────────────────────────────────────────────────
     def display_image(self):
-        # Find the next valid image index if current one is missing
-        if self.image_files:
-            original_current_index = self.current_index
-            found_valid_file = False
-            for _ in range(len(self.image_files)): # Iterate up to length of list to find a valid file
-                if os.path.exists(os.path.join(IMAGE_FOLDER, self.image_files[self.current_index])):
-                    found_valid_file = True
-                    break
-                self.current_index = (self.current_index + 1) % len(self.image_files)
-                if self.current_index == original_current_index: # Looped completely without finding one
-                    break
+        if self._display_after_id: # Any deferred display from a progress-bar click is now redundant
+            self.root.after_cancel(self._display_after_id)
+            self._display_after_id = None
+        if self._refresh_after_id: # Likewise a queued refresh, since this is it
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        self._display_generation += 1 # Any decode still running for an earlier image is now stale
+
+        # Find the next valid image index if current one is missing. A file that turns out to
+        # be gone is dropped from the snapshot and the search repeats, so a run of vanished
+        # files is skipped in this one loop rather than a call per file.
+        while True:
+            if self.image_files:
+                original_current_index = self.current_index
+                found_valid_file = False
+                for _ in range(len(self.image_files)): # Iterate up to length of list to find a valid file
+                    if self.image_files[self.current_index] in self._folder_files:
+                        found_valid_file = True
+                        break
+                    self.current_index = (self.current_index + 1) % len(self.image_files)
+                    if self.current_index == original_current_index: # Looped completely without finding one
+                        break
             
-            if not found_valid_file:
-                messagebox.showerror("No images found", "All images in your list are missing from the folder or are inaccessible.")
-                self.image_files = [] # Clear the list as it contains no valid files
-                self.current_index = 0
+                if not found_valid_file:
+                    messagebox.showerror("No images found", "All images in your list are missing from the folder or are inaccessible.")
+                    self.image_files = [] # Clear the list as it contains no valid files
+                    self._meta = []
+                    self._status = bytearray()
+                    self.current_index = 0
+
+            if not self.image_files:
+                self.original_img = None
+                self._preview_img = None
+                self._clear_canvas()
+                self.canvas.config(bg="black") # Ensure canvas is black if no image
+                self._update_counter() # Will show "No images loaded."
+                self._draw_progress_blocks() # Update empty progress bar
+                return
 
-        if not self.image_files:
-            self.original_img = None
-            self.canvas.delete("all")
-            self.canvas.config(bg="black") # Ensure canvas is black if no image
-            self._update_counter() # Will show "No images loaded."
-            self._draw_progress_blocks() # Update empty progress bar
+            current_filename = self.image_files[self.current_index]
+            try:
+                self._img_stamp = _file_stamp(current_filename)
+                self._img_size = self._image_dims(current_filename, self._img_stamp)
+                break
+            except FileNotFoundError:
+                # Removed from the folder since the last scan: forget it and search again
+                self._folder_files.discard(current_filename)
+
+        # Canvas background and counter labels share the current image's status colour
+        status_color = self._current_status_color()
+        self.canvas.config(bg=status_color)
+        self._update_counter(status_color)
+        self._update_list_colors()
+        self._draw_progress_blocks() # Redraw progress bar with current status
+
+        img = self._cached_image(current_filename, self._img_stamp)
+        if img is not None:
+            self._show_image(img)
             return
 
-        path = os.path.join(IMAGE_FOLDER, self.image_files[self.current_index])
-        self.original_img = Image.open(path)
+        # Not decoded yet: show a placeholder and decode on a worker thread, so a slow
+        # disk or a huge file doesn't freeze the window
+        self.original_img = None # Zoom/pan do nothing until the image arrives
+        self._clear_canvas()
+        self._loading_text_id = self.canvas.create_text(
+            self.canvas.winfo_width() / 2, self.canvas.winfo_height() / 2, text="Loading…", fill="white")
+        self._executor.submit(self._load_for_display, current_filename, self._img_stamp,
+                              self._draft_size(), self._display_generation)
 
-        # Determine canvas background color based on rename status
-        current_filename = self.image_files[self.current_index]
-        
-        # Check against renamed_files values (new filenames) and dont_know_files
-        is_renamed_visual = False
-        for old_name, new_name in self.renamed_files.items():
-            if current_filename.lower() == new_name.lower():
-                is_renamed_visual = True
-                break
+    def _schedule_refresh(self):
+        """
+        Queues display_image (and with it the counter, list colours and progress bar) to run
+        once Tk is idle. Calls made before then share the one refresh, so a held arrow key or
+        tag-then-advance only redraws for the image that ends up current.
+        """
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.root.after_idle(self._do_refresh)
 
-        if current_filename in self.dont_know_files: # Check for "don't know" status (highest priority)
-            self.canvas.config(bg="red")
-        elif is_renamed_visual: 
-            self.canvas.config(bg="blue")
-        else: # Default for untagged
-            self.canvas.config(bg="black")
+    def _do_refresh(self):
+        self._refresh_after_id = None
+        self.display_image()
 
+    def _load_for_display(self, filename, stamp, draft_size, generation):
+        """Runs on a worker thread: decodes filename and hands the result back to the Tk thread."""
+        try:
+            img, error = self._get_image(filename, stamp, draft_size), None
+        except Exception as e:
+            img, error = None, e
+        try:
+            self.root.after(0, self._on_image_loaded, filename, generation, img, error)
+        except (RuntimeError, tk.TclError):
+            pass # Window already closed
+
+    def _on_image_loaded(self, filename, generation, img, error):
+        if generation != self._display_generation:
+            return # The user has moved on to another image since this decode started
+        if isinstance(error, FileNotFoundError):
+            # Removed from the folder since the last scan: forget it and move on. display_image
+            # itself skips any further missing files, so this is one call however many have gone.
+            self._folder_files.discard(filename)
+            self.display_image()
+        elif error is not None:
+            self._clear_canvas()
+            messagebox.showerror("Error", f"Could not open '{filename}':\n{error}")
+        else:
+            self._show_image(img)
+
+    def _show_image(self, img):
+        """Puts a decoded image for the current file on the canvas, fitted to the window."""
+        if self._loading_text_id is not None:
+            self.canvas.delete(self._loading_text_id)
+            self._loading_text_id = None
+        self.original_img = img
+        self._preview_img = None   # Built by _fit_to_window once the canvas size is known
+        self._rendered_size = None
         self._fit_to_window()
-        self._update_counter()
-        self._update_list_colors()
-        self._draw_progress_blocks() # Redraw progress bar with current status
+        self._prefetch_neighbours()
+
+    # ─── Image cache / prefetch ───────────────────────────────────
+    def _cached_image(self, filename, stamp):
+        """
+        Returns the decoded image for filename if it's in the cache and was decoded from the
+        file as it is now (same mtime and size, see _file_stamp), else None.
+        """
+        with self._img_cache_lock:
+            entry = self._img_cache.get(filename)
+            if entry is None:
+                return None
+            if entry[0] != stamp: # File changed on disk since it was decoded
+                self._drop_cached(filename)
+                return None
+            self._img_cache.move_to_end(filename)
+            return entry[1]
+
+    def _image_dims(self, filename, stamp):
+        """
+        Full-resolution (width, height) of filename. Served from the dims cache while the
+        file's mtime and size are unchanged; otherwise only the image header is read.
+        """
+        entry = self._dim_cache.get(filename)
+        if entry is not None and (entry[0], entry[1]) == stamp:
+            return entry[2], entry[3]
+        with Image.open(_image_path(filename)) as img:
+            w, h = img.size
+        self._dim_cache[filename] = (*stamp, w, h)
+        self._dim_cache_dirty = True
+        return w, h
+
+    def _get_image(self, filename, stamp, draft_size=None):
+        """Returns the decoded image for filename, from the prefetch cache when possible. Thread-safe."""
+        img = self._cached_image(filename, stamp)
+        if img is not None:
+            return img
+        img = _decode_image(_image_path(filename), draft_size)
+        self._cache_image(filename, stamp, img)
+        return img
+
+    def _draft_size(self):
+        """Size to decode images at: twice the canvas, like the preview. None until the canvas is laid out."""
+        cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if cw < 10 or ch < 10:
+            return None
+        return (2 * cw, 2 * ch)
+
+    def _request_full_image(self):
+        """
+        Re-decodes the current image at full resolution on the worker thread, for zoom levels
+        past the drafted size. Rendering carries on, upscaled, from the reduced image until it arrives.
+        """
+        if self._full_load_generation == self._display_generation:
+            return # Already requested for this image
+        self._full_load_generation = self._display_generation
+        self._executor.submit(self._load_full_image, self.image_files[self.current_index],
+                              self._img_stamp, self._display_generation)
+
+    def _load_full_image(self, filename, stamp, generation):
+        """Runs on a worker thread: decodes filename at full resolution and hands it to the Tk thread."""
+        try:
+            img = _decode_image(_image_path(filename))
+        except Exception:
+            return # Keep rendering from the reduced image
+        self._cache_image(filename, stamp, img)
+        try:
+            self.root.after(0, self._on_full_image_loaded, generation, img)
+        except (RuntimeError, tk.TclError):
+            pass # Window already closed
+
+    def _on_full_image_loaded(self, generation, img):
+        if generation != self._display_generation or self.original_img is None:
+            return # Moved on to another image since the decode started
+        self.original_img = img
+        self._rendered_size = None # Re-render the current zoom from the sharper pixels
+        self._render()
+
+    def _cache_image(self, filename, stamp, img):
+        with self._img_cache_lock:
+            self._drop_cached(filename)
+            self._img_cache[filename] = (stamp, img)
+            self._img_cache_bytes += _image_bytes(img)
+            # Evict the least recently used, but never the image just added
+            while len(self._img_cache) > 1 and (len(self._img_cache) > IMAGE_CACHE_SIZE
+                                                or self._img_cache_bytes > IMAGE_CACHE_BYTES):
+                _, (_, evicted) = self._img_cache.popitem(last=False)
+                self._img_cache_bytes -= _image_bytes(evicted)
+
+    def _drop_cached(self, filename):
+        """Removes filename from the image cache. Call with _img_cache_lock held."""
+        entry = self._img_cache.pop(filename, None)
+        if entry is not None:
+            self._img_cache_bytes -= _image_bytes(entry[1])
+
+    def _carry_cached(self, old_name, new_name):
+        """
+        After renaming a file, moves its cached pixels and dimensions to the new name.
+        A rename doesn't change the file's mtime or size, so the entries stay valid.
+        """
+        with self._img_cache_lock:
+            entry = self._img_cache.pop(old_name, None)
+            if entry is not None:
+                self._img_cache[new_name] = entry
+        dims = self._dim_cache.pop(old_name, None)
+        if dims is not None:
+            self._dim_cache[new_name] = dims
+            self._dim_cache_dirty = True
+
+    def _prefetch_neighbours(self):
+        """Decodes the next and previous images in the background while the user looks at this one."""
+        total_images = len(self.image_files)
+        if total_images < 2:
+            return
+        draft_size = self._draft_size()
+        for idx in (self.current_index + 1, self.current_index - 1):
+            self._executor.submit(self._prefetch, self.image_files[idx % total_images], draft_size)
+
+    def _prefetch(self, filename, draft_size):
+        """Runs on the worker thread. Must not touch any Tk widgets."""
+        try:
+            self._get_image(filename, _file_stamp(filename), draft_size)
+        except Exception:
+            return # Missing/unreadable files are reported when actually displayed
 
 
     def _fit_to_window(self):
+        if self._fit_after_id: # Called directly while a retry is queued: this call replaces it
+            self.root.after_cancel(self._fit_after_id)
+            self._fit_after_id = None
         self.root.update_idletasks()
         cw, ch = self.canvas.winfo_width(), self.canvas.winfo_height()
         if cw < 10 or ch < 10:
-            self.root.after(50, self._fit_to_window)
+            self._fit_after_id = self.root.after(50, self._fit_to_window)
             return
         if self.original_img: # Check if an image is loaded
-            iw, ih = self.original_img.size
+            iw, ih = self._img_size
             self.zoom = min((cw-40)/iw, (ch-40)/ih, 1.0)  # 20-px margin
             self.offset = [(cw - iw*self.zoom)/2, (ch - ih*self.zoom)/2]
+            if self._preview_img is None:
+                self._build_preview(cw, ch)
             self._apply_zoom_to_slider()
             self._render()
         else: # Clear canvas if no image
-            self.canvas.delete("all")
+            self._clear_canvas()
 
 
     def _render(self):
         if not self.original_img: # Check if an image is loaded
             return
 
-        iw, ih = self.original_img.size
+        iw, ih = self._img_size
         w, h = int(iw*self.zoom), int(ih*self.zoom)
         if w < 1 or h < 1: # Prevent errors with tiny sizes
             return
-        img = self.original_img.resize((w, h), Image.Resampling.LANCZOS)
-        self.tk_img = ImageTk.PhotoImage(img)
+
+        # Same size as last time (panning): the pixels are unchanged, just move the item
+        if (w, h) == self._rendered_size and self._canvas_img_id is not None:
+            self.canvas.coords(self._canvas_img_id, self.offset[0], self.offset[1])
+            return
+
+        # Resize from the smaller preview whenever it still has enough pixels
+        if self._preview_img is not None and w <= self._preview_img.width and h <= self._preview_img.height:
+            source = self._preview_img
+        else:
+            if self.original_img.size != self._img_size and (w > self.original_img.width or h > self.original_img.height):
+                # Zoomed in past the reduced-scale decode: fetch the full-resolution pixels once
+                self._request_full_image()
+            source = self.original_img
+        resample = Image.Resampling.BILINEAR if self._zooming else Image.Resampling.LANCZOS
+        img = source.resize((w, h), resample)
+        # Reuse the PhotoImage when the size hasn't changed (e.g. while panning)
+        # instead of allocating a new one every frame
+        if self.tk_img is not None and self.tk_img.width() == w and self.tk_img.height() == h:
+            self.tk_img.paste(img)
+        else:
+            self.tk_img = ImageTk.PhotoImage(img)
+
+        # Move/update the existing canvas item rather than deleting and recreating it
+        if self._canvas_img_id is None:
+            self._canvas_img_id = self.canvas.create_image(self.offset[0], self.offset[1], anchor=tk.NW, image=self.tk_img)
+        else:
+            self.canvas.itemconfig(self._canvas_img_id, image=self.tk_img)
+            self.canvas.coords(self._canvas_img_id, self.offset[0], self.offset[1])
+        self._rendered_size = (w, h)
+
+    def _build_preview(self, cw, ch):
+        """
+        Keeps a copy of the current image downsampled to about twice the canvas size.
+        Most zoom levels can be rendered from it, which is much cheaper than resizing
+        the full-resolution original on every wheel tick.
+        """
+        preview = self.original_img.copy()
+        preview.thumbnail((2 * cw, 2 * ch), Image.Resampling.LANCZOS)
+        self._preview_img = preview
+
+    def _clear_canvas(self):
+        """Removes the displayed image from the canvas."""
         self.canvas.delete("all")
-        self.canvas.create_image(self.offset[0], self.offset[1], anchor=tk.NW, image=self.tk_img)
+        self._canvas_img_id = None
+        self._loading_text_id = None
+        self._rendered_size = None
 
     # ─── Zoom logic ───────────────────────────────────────────────
     def zoom_relative(self, factor: float, centre: tuple | None = None):
@@ -618,6 +1248,18 @@ class ImageTagger:
         self.offset[1] = cy - (cy - oy)*factor
         self.zoom = new_zoom
         self._apply_zoom_to_slider()
+        # Render with the cheaper bilinear filter while zoom steps keep coming,
+        # then once more with LANCZOS when they stop
+        self._zooming = True
+        self._render()
+        if self._zoom_settle_id:
+            self.root.after_cancel(self._zoom_settle_id)
+        self._zoom_settle_id = self.root.after(100, self._finish_zoom)
+
+    def _finish_zoom(self):
+        self._zoom_settle_id = None
+        self._zooming = False
+        self._rendered_size = None # Force a fresh high-quality resize at the same size
         self._render()
 
     def _slider_zoom(self, val):
@@ -655,44 +1297,86 @@ class ImageTagger:
             self._render()
     
     # ─── Tag list / progress helpers ──
+    def _populate_listbox(self):
+        """
+        Refills the listbox from self.descriptions. Rows are inserted in chunks from
+        idle callbacks, so importing a very large sheet doesn't freeze the UI.
+        """
+        if self._insert_after_id:
+            self.root.after_cancel(self._insert_after_id)
+            self._insert_after_id = None
+        self.listbox.delete(0, tk.END)
+        self._listbox_path = str(self.listbox) # Tcl name of the widget, for _set_row_fg
+        self._desc_tuple = tuple(self.descriptions) # row -> description
+        self._desc_index = {d: i for i, d in enumerate(self._desc_tuple)} # description -> row
+        self._list_blue = set() # descriptions whose rows are currently drawn blue
+        self._pending_inserts = iter(self._desc_tuple)
+        self._insert_chunk()
+
+    def _insert_chunk(self):
+        self._insert_after_id = None
+        chunk = list(itertools.islice(self._pending_inserts, LISTBOX_INSERT_CHUNK))
+        if not chunk:
+            return
+        start = self.listbox.size()
+        self.listbox.insert(tk.END, *chunk)
+        for i, desc in enumerate(chunk, start): # Colour the new rows like _update_list_colors does
+            if desc in self.used_tags:
+                self._set_row_fg(i, "blue")
+                self._list_blue.add(desc)
+        self._insert_after_id = self.root.after_idle(self._insert_chunk)
+
     def _update_list_colors(self):
-        for i, desc in enumerate(self.descriptions):
-            clr = "blue" if desc in self.used_tags else "black"
-            self.listbox.itemconfig(i, fg=clr)
+        """
+        Recolours only the rows whose used/unused state changed since they were last drawn,
+        found by diffing used_tags against _list_blue, rather than repainting every row.
+        """
+        inserted = self.listbox.size()
+        for desc in self.used_tags - self._list_blue:
+            row = self._desc_index.get(desc)
+            if row is not None and row < inserted: # Later chunks are coloured as they're added
+                self._set_row_fg(row, "blue")
+                self._list_blue.add(desc)
+        for desc in self._list_blue - self.used_tags:
+            self._set_row_fg(self._desc_index[desc], "black")
+        self._list_blue &= self.used_tags
+
+    def _set_row_fg(self, row, color):
+        """
+        listbox.itemconfig(row, fg=color) as one raw Tcl call, skipping tkinter's per-call
+        option-dict handling; this runs for every blue row when a chunk of descriptions is inserted.
+        """
+        self.listbox.tk.call(self._listbox_path, "itemconfigure", row, "-foreground", color)
 
-    def _update_counter(self):
-        total_images = len(self.image_files)
-        current_image_num = self.current_index + 1
+    def _color_used_row(self, row):
+        """Turns the row that was just tagged blue, without diffing the whole list."""
+        self._set_row_fg(row, "blue")
+        self._list_blue.add(self._desc_tuple[row])
 
-        # Determine text color for progress and filename labels
-        text_color = "black"
-        if total_images > 0 and 0 <= self.current_index < total_images:
-            current_filename = self.image_files[self.current_index]
-            
-            # Check against renamed_files values (new filenames) and dont_know_files for label color
-            is_renamed_visual = False
-            for old_name, new_name in self.renamed_files.items():
-                if current_filename.lower() == new_name.lower():
-                    is_renamed_visual = True
-                    break
-
-            # Prioritize "don't know" (red) over renamed (blue) for filename label
-            if current_filename in self.dont_know_files:
-                text_color = "red"
-            elif is_renamed_visual:
-                text_color = "blue"
-            
-        self.progress_label.config(fg=text_color)
-        self.filename_label.config(fg=text_color)
+    def _current_status_color(self):
+        """
+        Colour for the current image's status: red for "don't know" (highest priority),
+        blue if it's a renamed file's new name, otherwise black.
+        """
+        if self.image_files[self.current_index] in self.dont_know_files:
+            return "red"
+        if self._meta[self.current_index].lower in self._new_to_old:
+            return "blue"
+        return "black"
+
+    def _update_counter(self, text_color=None):
+        """Updates the progress and filename labels. text_color saves recomputing the status when the caller has it."""
+        total_images = len(self.image_files)
 
-        # Update progress label
         if total_images > 0 and 0 <= self.current_index < total_images:
+            if text_color is None:
+                text_color = self._current_status_color()
             current_filename = self.image_files[self.current_index]
-            self.progress_label.config(text=f"Image {current_image_num} / {total_images}")
-            self.filename_label.config(text=f"Current: {current_filename}")
+            self.progress_label.config(text=f"Image {self.current_index + 1} / {total_images}", fg=text_color)
+            self.filename_label.config(text=f"Current: {current_filename}", fg=text_color)
         else:
-            self.progress_label.config(text="No images loaded.")
-            self.filename_label.config(text="") # Clear filename if no images
+            self.progress_label.config(text="No images loaded.", fg="black")
+            self.filename_label.config(text="", fg="black") # Clear filename if no images
 
 
     # ─── Navigation ------------------------------------------------
@@ -704,15 +1388,17 @@ class ImageTagger:
         attempts = 0
         while attempts < len(self.image_files):
             self.current_index = (self.current_index - 1 + len(self.image_files)) % len(self.image_files)
-            if os.path.exists(os.path.join(IMAGE_FOLDER, self.image_files[self.current_index])):
-                self.display_image()
-                self.save_progress() # Call the now-existing instance method
+            if self.image_files[self.current_index] in self._folder_files:
+                self._schedule_refresh()
+                self._schedule_save()
                 return # Found a valid file
             attempts += 1
         
         # If loop finishes, no valid image was found
         messagebox.showwarning("No Valid Images", "No previous valid image found. All images might be missing or inaccessible.")
         self.image_files = [] # Clear the list as it contains no valid files
+        self._meta = []
+        self._status = bytearray()
         self.current_index = 0
         self.display_image() # This will call _update_counter and _draw_progress_blocks to reflect empty state
 
@@ -724,15 +1410,17 @@ class ImageTagger:
         attempts = 0
         while attempts < len(self.image_files):
             self.current_index = (self.current_index + 1) % len(self.image_files)
-            if os.path.exists(os.path.join(IMAGE_FOLDER, self.image_files[self.current_index])):
-                self.display_image()
-                self.save_progress() # Save current state after changing image
+            if self.image_files[self.current_index] in self._folder_files:
+                self._schedule_refresh()
+                self._schedule_save() # Save current state after changing image
                 return # Found a valid file
             attempts += 1
         
         # If loop finishes, no valid image was found
         messagebox.showwarning("No Valid Images", "No next valid image found. All images might be missing or inaccessible.")
         self.image_files = [] # Clear the list as it contains no valid files
+        self._meta = []
+        self._status = bytearray()
         self.current_index = 0
         self.display_image() # This will call _update_counter and _draw_progress_blocks to reflect empty state
 
@@ -749,9 +1437,8 @@ class ImageTagger:
             messagebox.showwarning("No Selection", "Please select a description from the list.")
             return
 
-        selected_description = self.descriptions[selected_indices[0]].strip()
+        selected_description = self._desc_tuple[selected_indices[0]].strip()
         current_filename = self.image_files[self.current_index]
-        base_name_current, ext_current = os.path.splitext(current_filename)
 
         # Get detailed info for the selected description
         details = self.description_data.get(selected_description)
@@ -761,18 +1448,19 @@ class ImageTagger:
 
         object_number = details.get("Object Number", "")
         # Ensure object_number is safe for filenames
-        safe_object_number = "".join(c if c.isalnum() or c in (' ', '-', '_', '.') else '' for c in object_number).strip()
+        # Drop everything but letters, digits, space, '-', '_' and '.' (the same class _SANITIZE_RE replaces)
+        safe_object_number = _SANITIZE_RE.sub('', object_number).strip()
         safe_object_number = safe_object_number.replace(' ', '_')
 
         # Standardize the extension to lowercase for cross-platform consistency
-        ext = ext_current.lower()
+        ext = self._meta[self.current_index].ext
 
         # Initial new filename attempt
         new_filename_base = f"{safe_object_number}"
         new_filename = f"{new_filename_base}{ext}" # Combine base name with standardized extension
         
-        old_path = os.path.join(IMAGE_FOLDER, current_filename)
-        new_path = os.path.join(IMAGE_FOLDER, new_filename)
+        old_path = _image_path(current_filename)
+        new_path = _image_path(new_filename)
 
         # Check if the proposed new_filename (without suffix) is identical to the current filename
         # This handles cases where the file is already named correctly.
@@ -780,9 +1468,9 @@ class ImageTagger:
             messagebox.showinfo("No Change", f"File is already named '{new_filename}'.")
             self.used_tags.add(selected_description)
             self.dont_know_files.discard(current_filename) # Remove from don't know if tagged
-            self.save_progress()
-            self._update_list_colors()
-            self._draw_progress_blocks() # Redraw for visual feedback even if no rename
+            self.save_progress() # Written now: used_tags dedupes future tags
+            self._color_used_row(selected_indices[0])
+            self._recolor_block(self.current_index) # Visual feedback even if no rename
             self.next_image() # Auto-advance even if no rename happened
             return
 
@@ -792,38 +1480,54 @@ class ImageTagger:
 
         # Loop to find a unique filename if a duplicate exists
         # Use os.path.normcase for case-insensitive comparison on Windows
-        while os.path.exists(proposed_new_path) and os.path.normcase(proposed_new_path) != os.path.normcase(old_path):
+        # Taken names are found in the folder snapshot without touching the disk; only a name
+        # the snapshot doesn't know is checked with os.path.exists, in case it appeared since the scan.
+        while ((new_filename in self._folder_files or os.path.exists(proposed_new_path))
+               and os.path.normcase(proposed_new_path) != os.path.normcase(old_path)):
             # The condition `os.path.normcase(proposed_new_path) != os.path.normcase(old_path)`
             # is crucial. It ensures we only add a suffix if the existing file is *not*
             # the current file itself (in a case-insensitive way on Windows).
             
             new_filename = f"{new_filename_base}_{suffix}{ext}"
-            proposed_new_path = os.path.join(IMAGE_FOLDER, new_filename)
+            proposed_new_path = _image_path(new_filename)
             suffix += 1
 
         # After the loop, `proposed_new_path` is the unique path we should use.
         # Update `new_filename` and `new_path` to reflect the final chosen name (with suffix if any).
         new_path = proposed_new_path
         # Extract the filename part from the final `new_path`
-        new_filename = os.path.basename(new_path)
+        new_filename = sys.intern(os.path.basename(new_path))
 
         try:
             # Rename the file
-            shutil.move(old_path, new_path)
+            os.replace(old_path, new_path) # Same folder, so a single rename(2)
     #        messagebox.showinfo("Success", f"Renamed '{current_filename}' to '{new_filename}'")
 
             # Update internal state
             self.used_tags.add(selected_description)
+            previous_new = self.renamed_files.get(current_filename)
             self.renamed_files[current_filename] = new_filename # Store old -> new mapping
+            self._folder_files.discard(current_filename)
+            self._folder_files.add(new_filename)
+            self._carry_cached(current_filename, new_filename)
+            # Patch the lookups for this one entry instead of rebuilding them from every rename
+            if previous_new is not None: # This name was renamed before; its old target no longer counts
+                self._new_to_old.pop(_name_key(previous_new), None)
+            old_key, new_key = _name_key(current_filename), _name_key(new_filename)
+            self._new_to_old.setdefault(new_key, current_filename)
+            if old_key != new_key: # A case-only rename leaves the original name in use
+                self._renamed_originals_lc.add(old_key)
             self.dont_know_files.discard(current_filename) # Remove from don't know if tagged
 
             # Update the image_files list with the new filename
             self.image_files[self.current_index] = new_filename
+            self._meta[self.current_index] = _file_meta(new_filename)
 
-            self.save_progress() # Save after updating internal state
+            self.save_progress() # Written now, so the rename on disk is always on record for undo
             
-            # Refresh UI
-            self._update_list_colors()
+            # Refresh UI: only the tagged row and this image's block can have changed colour
+            self._color_used_row(selected_indices[0])
+            self._recolor_block(self.current_index)
             self.next_image() # Auto-advance to the next image
             
         except FileNotFoundError:
@@ -837,24 +1541,17 @@ class ImageTagger:
             return
 
         current_filename = self.image_files[self.current_index]
+        current_lc = self._meta[self.current_index].lower
         
-        original_filename = None
-        # Iterate through renamed_files to find the original name, comparing case-insensitively
-        for old_name, new_name in self.renamed_files.items():
-            if current_filename.lower() == new_name.lower(): # Match current file (new name) to a stored new_name
-                original_filename = old_name
-                break
+        # Find the original name, comparing case-insensitively
+        original_filename = self._new_to_old.get(current_lc)
         
         if not original_filename:
             # Check if the current file *was* the original name of a renamed file that now exists under a new name
             # This handles cases where you've moved past a renamed file and come back to its new name
             # This check is a bit complex due to potential case differences, so relying primarily on the above.
             # However, if it's not a value (new name), it means it's either untouched or an original name.
-            is_original_name_in_map = False
-            for old_n, new_n in self.renamed_files.items():
-                if current_filename.lower() == old_n.lower() and current_filename.lower() != new_n.lower():
-                    is_original_name_in_map = True
-                    break
+            is_original_name_in_map = current_lc in self._renamed_originals_lc
             
             if is_original_name_in_map:
                 messagebox.showinfo("Not Renamed (Currently)", f"'{current_filename}' was renamed. To undo, you need to be on the renamed file itself (e.g., 'OBJECT_XYZ.jpg'), not its original name.")
@@ -863,14 +1560,17 @@ class ImageTagger:
             messagebox.showinfo("Not Renamed", f"'{current_filename}' has not been renamed by this application.")
             return
 
-        old_path = os.path.join(IMAGE_FOLDER, current_filename)
-        new_path = os.path.join(IMAGE_FOLDER, original_filename)
+        old_path = _image_path(current_filename)
+        new_path = _image_path(original_filename)
 
         if not os.path.exists(old_path):
             messagebox.showerror("File Missing", f"The current file '{current_filename}' is missing from the '{IMAGE_FOLDER}' folder.")
             # Attempt to clean up renamed_files if the new file is gone
-            if original_filename in self.renamed_files and self.renamed_files[original_filename].lower() == current_filename.lower():
+            # original_filename came from _new_to_old, so its entry already maps to this file
+            if original_filename in self.renamed_files:
                 del self.renamed_files[original_filename]
+                self._rebuild_rename_lookups()
+                self._rebuild_status()
                 self.save_progress()
                 self._draw_progress_blocks()
             return
@@ -885,12 +1585,15 @@ class ImageTagger:
                 return
 
         try:
-            shutil.move(old_path, new_path)
+            os.replace(old_path, new_path)
             messagebox.showinfo("Success", f"Undid rename: '{current_filename}' reverted to '{original_filename}'")
 
             # Update internal state
             if original_filename in self.renamed_files:
                 del self.renamed_files[original_filename] # Remove the mapping
+                # Patch the lookups for this one entry instead of rebuilding them from every rename
+                self._new_to_old.pop(current_lc, None)
+                self._renamed_originals_lc.discard(_name_key(original_filename))
 
             # Remove from used_tags - this logic is fine as used_tags stores descriptions, not filenames
             # self.used_tags = {tag for tag in self.used_tags if tag not in self.descriptions} # This line seems incorrect
@@ -900,10 +1603,15 @@ class ImageTagger:
 
             # Update the image_files list with the original filename
             self.image_files[self.current_index] = original_filename
+            self._meta[self.current_index] = _file_meta(original_filename)
+            self._folder_files.discard(current_filename)
+            self._folder_files.add(original_filename)
+            self._carry_cached(current_filename, original_filename)
             
 
-            self.save_progress()
-            self.display_image() # Re-display the current image, which is now original_filename
+            self.save_progress() # Written now, to match the file just renamed back
+            self._recolor_block(self.current_index)
+            self._schedule_refresh() # Re-display the current image, which is now original_filename
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to undo rename: {e}")
@@ -925,18 +1633,22 @@ class ImageTagger:
         
         # Remove from renamed_files if it was previously renamed, as "don't know" takes precedence
         # Find if this file was a *new name* from a previous rename operation, considering case
-        original_name_of_current = None
-        for old_n, new_n in list(self.renamed_files.items()): # Use list() to allow modification during iteration
-            if current_filename.lower() == new_n.lower():
-                original_name_of_current = old_n
-                break
+        original_name_of_current = self._new_to_old.pop(self._meta[self.current_index].lower, None)
         
         if original_name_of_current:
             del self.renamed_files[original_name_of_current] # Remove the entry from renamed_files
-            
-        # Re-order image_files: move current image to the end
-        self.image_files.pop(self.current_index)
-        self.image_files.append(current_filename)
+            # Patch the lookups for this one entry instead of rebuilding them from every rename
+            self._renamed_originals_lc.discard(_name_key(original_name_of_current))
+            # A copy still listed under the original name is no longer "renamed" either
+            self._rebuild_status()
+
+        self._status[self.current_index] = STATUS_DONT_KNOW
+
+        # Re-order image_files: move current image to the end (nothing to move if it's already last)
+        if self.current_index != len(self.image_files) - 1:
+            self.image_files.append(self.image_files.pop(self.current_index))
+            self._meta.append(self._meta.pop(self.current_index))
+            self._status.append(self._status.pop(self.current_index))
 
         # The current_index stays the same logically, as the image that was *at* this index
         # is now gone, and the next image in the list naturally moves into its place.
@@ -948,11 +1660,16 @@ class ImageTagger:
 
         messagebox.showinfo("Moved", f"'{current_filename}' marked as 'Don't know' and moved to end of list.")
         
-        self.save_progress() # Save after moving and updating state
-        self.display_image() # Refresh display (will naturally show the new image at self.current_index)
+        self._schedule_save() # Save after moving and updating state
+        self._schedule_refresh() # Refresh display (will naturally show the new image at self.current_index)
 
 
-if __name__ == "__main__":
+def main(master=None):
+    """
+    Starts the tagger. Run on its own it creates a Tk root and blocks in mainloop.
+    Given a master window (e.g. from processimages.py) it opens as a Toplevel of
+    that app and returns the window straight away.
+    """
     # Create the Images folder if it doesn't exist
     if not os.path.exists(IMAGE_FOLDER):
         os.makedirs(IMAGE_FOLDER)
@@ -963,6 +1680,20 @@ if __name__ == "__main__":
         df_empty.to_excel(EXCEL_FILE, index=False)
         print(f"Created empty {EXCEL_FILE}. Please populate it with descriptions.")
 
-    root = tk.Tk()
-    app = ImageTagger(root)
-    root.mainloop()
+    if master is None:
+        root = tk.Tk()
+        app = ImageTagger(root)
+        root.mainloop()
+        return None
+
+    window = tk.Toplevel(master)
+    try:
+        app = ImageTagger(window)
+    except BaseException:
+        window.destroy() # Don't leave an empty window behind
+        raise
+    return window
+
+
+if __name__ == "__main__":
+    main()